@@ -7,7 +7,7 @@ ERD v2 기준 12개 테이블 CRUD 함수 정의
 models.py와 100% 호환
 """
 from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import desc, asc, and_, or_, func
+from sqlalchemy import desc, asc, and_, or_, case, func
 from typing import Optional, List, Dict, Any
 from datetime import datetime
 from . import models, schemas
@@ -303,25 +303,31 @@ def get_project_statistics(db: Session, project_id: int) -> Optional[Dict[str, A
     if not project:
         return None
     
-    # 페이지 수 집계
-    total_pages = db.query(func.count(models.Page.page_id)).filter(
-        models.Page.project_id == project_id
-    ).scalar()
-    
-    # 분석 완료 페이지 수
-    completed_pages = db.query(func.count(models.Page.page_id)).filter(
-        and_(
-            models.Page.project_id == project_id,
-            models.Page.analysis_status == models.AnalysisStatusEnum.COMPLETED
-        )
-    ).scalar()
-    
-    # 총 레이아웃 요소 수
-    total_elements = db.query(func.count(models.LayoutElement.element_id)).join(
-        models.Page
+    # 페이지 수 / 분석 완료 페이지 수 (조건부 집계로 한 번에 조회)
+    total_pages, completed_pages = db.query(
+        func.count(models.Page.page_id),
+        func.coalesce(
+            func.sum(
+                case(
+                    (models.Page.analysis_status == models.AnalysisStatusEnum.COMPLETED, 1),
+                    else_=0,
+                )
+            ),
+            0,
+        ),
     ).filter(
         models.Page.project_id == project_id
-    ).scalar()
+    ).one()
+    completed_pages = int(completed_pages)
+    
+    # 총 레이아웃 요소 수 (페이지가 없으면 JOIN 집계 생략)
+    total_elements = 0
+    if total_pages:
+        total_elements = db.query(func.count(models.LayoutElement.element_id)).join(
+            models.Page
+        ).filter(
+            models.Page.project_id == project_id
+        ).scalar()
     
     return {
         "project_id": project_id,
@@ -18,7 +18,7 @@ from dotenv import load_dotenv
 
 from fastapi import Depends, FastAPI, HTTPException, status
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from fastapi.staticfiles import StaticFiles
 from sqlalchemy import text
 from sqlalchemy.orm import Session
@@ -64,6 +64,7 @@ app = FastAPI(
     * **Document**: python-docx
     """,
     version="1.0.1",
+    default_response_class=ORJSONResponse,  # orjson 기반 JSON 직렬화
     docs_url="/docs",
     redoc_url="/redoc",
     openapi_url="/openapi.json",
@@ -201,7 +202,7 @@ async def health_check(db: Session = Depends(get_db)):
 @app.exception_handler(HTTPException)
 async def http_exception_handler(request, exc):
     """HTTP 예외 핸들러"""
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=exc.status_code,
         content={
             "error": exc.detail,
@@ -213,7 +214,7 @@ async def http_exception_handler(request, exc):
 @app.exception_handler(Exception)
 async def general_exception_handler(request, exc):
     """일반 예외 핸들러"""
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=500,
         content={
             "error": "Internal Server Error",
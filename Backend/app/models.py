@@ -208,6 +208,7 @@ class Page(Base):
         UniqueConstraint("project_id", "page_number", name="uk_project_page"),
         Index("idx_project_id", "project_id"),
         Index("idx_analysis_status", "analysis_status"),
+        Index("idx_project_status", "project_id", "analysis_status"),  # 프로젝트별 상태 집계
     )
     
     def __repr__(self):
@@ -403,6 +404,7 @@ class TextVersion(Base):
         UniqueConstraint("page_id", "version_number", name="uk_page_version"),
         Index("idx_page_id", "page_id"),
         Index("idx_is_current", "is_current"),
+        Index("idx_page_current", "page_id", "is_current", "created_at"),  # 현재 버전/최신 시각 조회
     )
     
     def __repr__(self):
@@ -75,8 +75,12 @@ async def analyze_project(
     - 모델: 싱글톤 패턴으로 메모리 효율적 (중복 로드 방지)
     - 권장: 모든 환경 (CPU 4코어 이상, RAM 4GB+)
     """
-    project = db.query(Project).filter(Project.project_id == project_id).first()
-    if not project:
+    project_exists = (
+        db.query(Project.project_id)
+        .filter(Project.project_id == project_id)
+        .scalar()
+    )
+    if not project_exists:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="프로젝트를 찾을 수 없습니다.")
     if payload.analysis_model and not is_supported_model(payload.analysis_model):
         raise HTTPException(
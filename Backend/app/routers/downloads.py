@@ -7,7 +7,6 @@ from sqlalchemy.orm import Session
 
 from .. import schemas
 from ..database import get_db
-from ..models import Project
 from ..services.download_service import (
     generate_combined_text,
     generate_word_document,
@@ -33,19 +32,12 @@ def get_combined_text(
     프로젝트의 최신 텍스트 버전을 통합하여 반환합니다.
     CombinedResult 캐시가 최신이면 캐시를 사용합니다.
     """
-    project_exists = (
-        db.query(Project.project_id)
-        .filter(Project.project_id == project_id)
-        .scalar()
-    )
-    if not project_exists:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="프로젝트를 찾을 수 없습니다.")
-
+    # 프로젝트 존재 여부는 서비스 계층의 조회에서 함께 확인 (없으면 ValueError → 404)
     try:
         combined_data = generate_combined_text(db, project_id, use_cache=True)
         return schemas.CombinedTextResponse.model_validate(combined_data)
     except ValueError as value_error:
-        logger.error(f"통합 텍스트 생성 실패 (ValueError): project_id={project_id} / error={str(value_error)}", exc_info=True)
+        logger.warning(f"통합 텍스트 생성 실패 (ValueError): project_id={project_id} / error={str(value_error)}")
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(value_error)) from value_error
     except Exception as error:  # pylint: disable=broad-except
         logger.error(f"통합 텍스트 생성 실패: project_id={project_id} / error={str(error)}", exc_info=True)
@@ -68,14 +60,7 @@ def download_document(
     """
     프로젝트의 통합 텍스트를 Word(.docx) 문서로 생성하여 스트리밍 응답으로 반환합니다.
     """
-    project_exists = (
-        db.query(Project.project_id)
-        .filter(Project.project_id == project_id)
-        .scalar()
-    )
-    if not project_exists:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="프로젝트를 찾을 수 없습니다.")
-
+    # 프로젝트 존재 여부는 서비스 계층의 조회에서 함께 확인 (없으면 ValueError → 404)
     try:
         filename, file_stream = generate_word_document(db, project_id, use_cache=True)
         headers = {"Content-Disposition": f'attachment; filename="{filename}"'}
@@ -14,7 +14,7 @@ from sqlalchemy.orm import Session
 
 from .. import crud, schemas
 from ..database import get_db
-from ..models import AnalysisStatusEnum, AnalysisModeEnum, Page, Project
+from ..models import AnalysisStatusEnum, AnalysisModeEnum, LayoutElement, Page, Project
 from ..services.pdf_processor import pdf_processor
 from ..services.text_version_service import (
     get_current_page_text,
@@ -95,8 +95,12 @@ async def upload_page(
     - PDF 업로드: 다중 페이지 자동 생성
     """
     if project_id is not None:
-        project = crud.get_project(db, project_id)
-        if not project:
+        project_exists = (
+            db.query(Project.project_id)
+            .filter(Project.project_id == project_id)
+            .scalar()
+        )
+        if not project_exists:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="프로젝트를 찾을 수 없습니다.",
@@ -322,39 +326,48 @@ def get_page_stats(
     - 클래스별 평균 신뢰도
     - 처리 시간
     """
-    page = crud.get_page_with_elements(db, page_id)
+    page = crud.get_page(db, page_id)
     if not page:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="페이지를 찾을 수 없습니다.",
         )
 
+    # 통계에는 클래스명/신뢰도만 필요하므로 ORM 객체(및 OCR/AI 텍스트) 대신 컬럼 튜플만 조회
+    element_rows = (
+        db.query(LayoutElement.class_name, LayoutElement.confidence)
+        .filter(LayoutElement.page_id == page_id)
+        .all()
+    )
+
     distribution: Dict[str, int] = {}
     confidence_sums: Dict[str, float] = {}
     confidence_counts: Dict[str, int] = {}
+    anchor_count = 0
+    total_elements = 0
 
-    for element in page.layout_elements:
-        class_name = element.class_name or "unknown"
+    # 분포/신뢰도/앵커 수를 한 번의 순회로 집계
+    for raw_class_name, confidence in element_rows:
+        total_elements += 1
+        if raw_class_name in ANCHOR_CLASS_NAMES:
+            anchor_count += 1
+
+        class_name = raw_class_name or "unknown"
         distribution[class_name] = distribution.get(class_name, 0) + 1
 
-        if element.confidence is not None:
-            confidence_sums[class_name] = confidence_sums.get(class_name, 0.0) + float(element.confidence)
+        if confidence is not None:
+            confidence_sums[class_name] = confidence_sums.get(class_name, 0.0) + float(confidence)
             confidence_counts[class_name] = confidence_counts.get(class_name, 0) + 1
 
-    confidence_scores: Dict[str, float] = {}
-    for class_name, total in confidence_sums.items():
-        count = confidence_counts.get(class_name, 0)
-        if count:
-            confidence_scores[class_name] = total / count
-
-    anchor_count = sum(
-        1 for element in page.layout_elements if element.class_name in ANCHOR_CLASS_NAMES
-    )
+    confidence_scores: Dict[str, float] = {
+        class_name: total / confidence_counts[class_name]
+        for class_name, total in confidence_sums.items()
+    }
 
     return schemas.PageStatsResponse(
         page_id=page.page_id,
         project_id=page.project_id,
-        total_elements=len(page.layout_elements),
+        total_elements=total_elements,
         anchor_element_count=anchor_count,
         processing_time=page.processing_time,
         class_distribution=distribution,
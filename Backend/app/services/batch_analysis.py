@@ -47,6 +47,7 @@ from loguru import logger
 from PIL import Image
 from sqlalchemy.orm import Session, selectinload
 
+from ..database import SessionLocal
 from ..models import LayoutElement, Page, Project
 from .analysis_service import AnalysisService
 from .model_registry import model_registry
@@ -191,7 +192,6 @@ async def get_async_db_session():
         병렬 처리 시 각 작업마다 독립적인 세션을 사용하여
         세션 충돌을 방지합니다.
     """
-    from ..database import SessionLocal
     session = SessionLocal()
     try:
         yield session
@@ -203,30 +203,39 @@ async def get_async_db_session():
         await asyncio.to_thread(session.close)
 
 
-def _resolve_image_path(image_path: str) -> Path:
+def _image_path_candidates(image_path: str) -> List[Path]:
     """
-    Page.image_path 값을 절대 경로로 변환합니다.
+    Page.image_path 값으로부터 탐색할 절대 경로 후보 목록을 만듭니다.
     """
     raw_path = Path(image_path)
-    candidates = []
-
     if raw_path.is_absolute():
-        candidates.append(raw_path)
-    else:
-        candidates.append((UPLOADS_ROOT / raw_path).resolve())
-        candidates.append((Path.cwd() / "uploads" / raw_path).resolve())
-        candidates.append((Path.cwd() / raw_path).resolve())
+        return [raw_path]
+    return [
+        (UPLOADS_ROOT / raw_path).resolve(),
+        (Path.cwd() / "uploads" / raw_path).resolve(),
+        (Path.cwd() / raw_path).resolve(),
+    ]
 
-    for candidate in candidates:
-        if candidate.exists():
-            return candidate
 
-    raise FileNotFoundError(
+def _image_not_found(candidates: List[Path]) -> FileNotFoundError:
+    return FileNotFoundError(
         "이미지 파일을 찾을 수 없습니다. "
         f"확인된 경로: {[str(path) for path in candidates]}"
     )
 
 
+def _resolve_image_path(image_path: str) -> Path:
+    """
+    Page.image_path 값을 절대 경로로 변환합니다.
+    """
+    candidates = _image_path_candidates(image_path)
+    for candidate in candidates:
+        if candidate.exists():
+            return candidate
+
+    raise _image_not_found(candidates)
+
+
 def _load_page_image(page: Page) -> np.ndarray:
     """
     페이지 객체에서 이미지를 로드하고, 해상도 정보를 갱신합니다.
@@ -268,11 +277,18 @@ async def _load_page_image_async(page: Page) -> np.ndarray:
         >>> image = await _load_page_image_async(page)
         >>> height, width = image.shape[:2]
     """
-    resolved_path = _resolve_image_path(page.image_path)
-    
     # 비동기 파일 읽기 (I/O 대기 시간 최소화)
-    async with aiofiles.open(resolved_path, 'rb') as f:
-        image_data = await f.read()
+    # exists() 확인 후 open 하지 않고 바로 열어 후보당 syscall 1회로 처리
+    candidates = _image_path_candidates(page.image_path)
+    for resolved_path in candidates:
+        try:
+            async with aiofiles.open(resolved_path, 'rb') as f:
+                image_data = await f.read()
+            break
+        except FileNotFoundError:
+            continue
+    else:
+        raise _image_not_found(candidates)
     
     # 이미지 디코딩 (CPU 바운드 작업은 스레드 풀로)
     def decode_image(data: bytes) -> np.ndarray:
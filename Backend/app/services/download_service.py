@@ -14,6 +14,7 @@ from datetime import datetime
 from typing import Dict, List, Optional, Tuple
 
 from loguru import logger
+from sqlalchemy import func
 from sqlalchemy.orm import Session, selectinload
 
 from ..models import CombinedResult, Page, Project, TextVersion
@@ -57,9 +58,21 @@ def _fetch_current_text_versions(db: Session, page_ids: List[int]) -> Dict[int,
     return {version.page_id: version for version in versions}
 
 
-def _latest_text_timestamp(versions: Dict[int, TextVersion]) -> Optional[datetime]:
-    timestamps = [version.created_at for version in versions.values() if version.created_at]
-    return max(timestamps) if timestamps else None
+def _fetch_latest_text_timestamp(db: Session, page_ids: List[int]) -> Optional[datetime]:
+    """
+    현재 텍스트 버전 중 가장 최근 생성 시각을 MAX 집계로 조회합니다.
+    캐시 신선도 판단에는 본문(content)이 필요 없으므로 버전 행 전체를 읽지 않습니다.
+    """
+    if not page_ids:
+        return None
+    return (
+        db.query(func.max(TextVersion.created_at))
+        .filter(
+            TextVersion.page_id.in_(page_ids),
+            TextVersion.is_current.is_(True),
+        )
+        .scalar()
+    )
 
 
 def _combined_result_is_fresh(
@@ -150,10 +163,7 @@ def generate_combined_text(
     logger.debug(f"프로젝트 조회 완료: pages={len(project.pages)}")
     
     page_ids = [page.page_id for page in project.pages]
-    versions = _fetch_current_text_versions(db, page_ids)
-    logger.debug(f"텍스트 버전 조회 완료: versions={len(versions)}")
-    
-    latest_version_time = _latest_text_timestamp(versions)
+    latest_version_time = _fetch_latest_text_timestamp(db, page_ids)
     logger.debug(f"최신 텍스트 시간: {latest_version_time}")
 
     combined_record = (
@@ -188,6 +198,10 @@ def generate_combined_text(
         logger.debug(f"캐시 반환 데이터: project_id={project_id}, stats={stats}")
         return result
 
+    # 캐시 미스인 경우에만 본문을 포함한 텍스트 버전을 로드
+    versions = _fetch_current_text_versions(db, page_ids)
+    logger.debug(f"텍스트 버전 조회 완료: versions={len(versions)}")
+
     combined_text, stats = _format_combined_sections(project.pages, versions)
     combined_record = _upsert_combined_result(db, project_id, combined_text, stats)
 
@@ -213,6 +227,7 @@ def generate_word_document(
         raise ImportError("python-docx 라이브러리가 필요합니다. pip install python-docx")
 
     combined_data = generate_combined_text(db, project_id, use_cache=use_cache)
+    generated_now = datetime.now()  # 문서 메타 정보와 파일명에 같은 시각 사용
     project_name = combined_data.get("project_name") or f"프로젝트 {project_id}"
     combined_text = combined_data.get("combined_text", "")
 
@@ -221,7 +236,7 @@ def generate_word_document(
     title.alignment = WD_ALIGN_PARAGRAPH.CENTER
 
     meta_paragraph = document.add_paragraph(
-        f"생성일: {datetime.now().strftime('%Y-%m-%d %H:%M')}"
+        f"생성일: {generated_now.strftime('%Y-%m-%d %H:%M')}"
     )
     meta_paragraph.alignment = WD_ALIGN_PARAGRAPH.RIGHT
 
@@ -250,7 +265,7 @@ def generate_word_document(
     document.save(file_stream)
     file_stream.seek(0)
 
-    filename = f"SmartEyeSsen_{project_id}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.docx"
+    filename = f"SmartEyeSsen_{project_id}_{generated_now.strftime('%Y%m%d_%H%M%S')}.docx"
     return filename, file_stream
 
 
@@ -10,32 +10,52 @@ PyMuPDF (fitz)를 사용하여 고품질 이미지 변환을 수행합니다.
 from typing import List, Dict, Optional, Tuple
 from loguru import logger
 import os
+import threading
 import fitz  # PyMuPDF
-from PIL import Image
-import io
 from pathlib import Path
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
 DEFAULT_PDF_DPI = 300
+DEFAULT_IMAGE_FORMAT = "jpeg"
+
+# 출력 포맷 → 파일 확장자 매핑
+# ppm은 무압축 포맷으로 인코딩 비용이 없지만 파일 크기가 크고 브라우저에서 표시되지 않습니다.
+IMAGE_FORMAT_EXTENSIONS = {
+    "jpeg": "jpg",
+    "png": "png",
+    "ppm": "ppm",
+}
 
 
 class PDFProcessor:
     """PDF 파일 처리 클래스"""
 
-    def __init__(self, upload_directory: str = "uploads", dpi: Optional[int] = None):
+    def __init__(
+        self,
+        upload_directory: str = "uploads",
+        dpi: Optional[int] = None,
+        image_format: Optional[str] = None,
+    ):
         """
         PDF 처리기 초기화
 
         Args:
             upload_directory: 파일 저장 기본 디렉토리
             dpi: 이미지 변환 해상도 (기본값: 300)
+            image_format: 페이지 이미지 포맷 (jpeg/png/ppm, 기본값: jpeg)
         """
         self.upload_directory = Path(upload_directory).resolve()
         self.dpi = self._resolve_dpi(dpi)
+        # DPI 기반 확대 비율 (72 DPI가 기본) - 인스턴스 수명 동안 고정
+        self._zoom = self.dpi / 72
+        self._matrix = fitz.Matrix(self._zoom, self._zoom)
+        self.image_format = self._resolve_image_format(image_format)
+        self.image_extension = IMAGE_FORMAT_EXTENSIONS[self.image_format]
         self.jpeg_quality = 95
         os.makedirs(self.upload_directory, exist_ok=True)
         logger.info(
-            f"PDFProcessor 초기화 완료 - DPI: {self.dpi}, 저장 경로: {self.upload_directory}"
+            f"PDFProcessor 초기화 완료 - DPI: {self.dpi}, 포맷: {self.image_format}, "
+            f"저장 경로: {self.upload_directory}"
         )
 
     @staticmethod
@@ -59,6 +79,41 @@ class PDFProcessor:
                 )
         return DEFAULT_PDF_DPI
 
+    @staticmethod
+    def _resolve_image_format(provided_format: Optional[str]) -> str:
+        """환경 변수와 인자 값을 고려해 페이지 이미지 포맷을 결정"""
+        candidate = provided_format or os.getenv("PDF_PROCESSOR_IMAGE_FORMAT")
+        if not candidate:
+            return DEFAULT_IMAGE_FORMAT
+
+        normalized = candidate.strip().lower()
+        if normalized == "jpg":
+            normalized = "jpeg"
+        if normalized not in IMAGE_FORMAT_EXTENSIONS:
+            logger.warning(
+                f"지원하지 않는 이미지 포맷 '{candidate}'이(가) 지정되어 기본값 {DEFAULT_IMAGE_FORMAT}을 사용합니다."
+            )
+            return DEFAULT_IMAGE_FORMAT
+        return normalized
+
+    def _save_pixmap(self, pix: "fitz.Pixmap", full_path: Path) -> None:
+        """
+        렌더링된 Pixmap을 설정된 포맷으로 바로 저장
+
+        JPEG 재디코딩/재인코딩 없이 Pixmap 버퍼에서 한 번만 인코딩하고,
+        파일 객체 래퍼 없이 raw fd 하나로 기록합니다.
+        """
+        image_bytes = pix.tobytes(self.image_format, jpg_quality=self.jpeg_quality)
+        flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+        fd = os.open(full_path, flags, 0o644)
+        try:
+            view = memoryview(image_bytes)
+            while view:
+                written = os.write(fd, view)
+                view = view[written:]
+        finally:
+            os.close(fd)
+
     def convert_pdf_to_images(
         self,
         pdf_bytes: bytes,
@@ -122,25 +177,18 @@ class PDFProcessor:
                     # PDF 페이지를 Pixmap으로 렌더링
                     page = pdf_document[page_index]
 
-                    # DPI 기반 확대 비율 계산 (72 DPI가 기본)
-                    zoom = self.dpi / 72
-                    mat = fitz.Matrix(zoom, zoom)
-                    pix = page.get_pixmap(matrix=mat, alpha=False)
-
-                    # PIL Image로 변환
-                    img_data = pix.tobytes("jpeg")
-                    img = Image.open(io.BytesIO(img_data))
+                    pix = page.get_pixmap(matrix=self._matrix, alpha=False)
 
-                    # 이미지 크기
-                    width, height = img.size
+                    # 이미지 크기 (Pixmap 크기 = 저장 이미지 크기)
+                    width, height = pix.width, pix.height
 
                     # 파일명 및 경로 생성
-                    filename = f"page_{page_number}.jpg"
+                    filename = f"page_{page_number}.{self.image_extension}"
                     full_path = project_dir / filename
                     public_path = Path("uploads") / str(project_id) / filename
 
-                    # 이미지 저장 (JPEG 품질 적용)
-                    img.save(str(full_path), "JPEG", quality=self.jpeg_quality, optimize=True)
+                    # 이미지 저장 (Pixmap에서 직접 인코딩)
+                    self._save_pixmap(pix, full_path)
 
                     # 변환 정보 저장
                     page_info = {
@@ -220,6 +268,11 @@ class PDFProcessor:
         pdf_document = None
         converted_pages = []
 
+        # 워커 스레드별 PDF 문서 인스턴스 (페이지마다 다시 파싱하지 않도록 재사용)
+        worker_state = threading.local()
+        worker_documents: List["fitz.Document"] = []
+        worker_documents_lock = threading.Lock()
+
         try:
             # PDF 문서 열기
             pdf_document = fitz.open(stream=pdf_bytes, filetype="pdf")
@@ -241,40 +294,41 @@ class PDFProcessor:
             
             logger.info(f"병렬 변환 시작: {max_workers}개 워커 사용")
 
+            def get_worker_document() -> "fitz.Document":
+                """
+                현재 워커 스레드 전용 PDF 문서 반환
+
+                PyMuPDF는 Document 객체를 스레드 간에 공유하지 않으면 스레드 안전하므로,
+                스레드당 한 번만 열어서 해당 스레드가 맡은 모든 페이지에 재사용합니다.
+                """
+                document = getattr(worker_state, "document", None)
+                if document is None:
+                    document = fitz.open(stream=pdf_bytes, filetype="pdf")
+                    worker_state.document = document
+                    with worker_documents_lock:
+                        worker_documents.append(document)
+                return document
+
             def convert_single_page(page_index: int) -> Dict[str, any]:
                 """
-                단일 페이지 변환 (완전 독립 실행)
-                
-                각 스레드가 독립적인 PDF 문서 인스턴스를 생성하여
-                진정한 병렬 처리를 수행합니다.
+                단일 페이지 변환 (워커 스레드 전용 문서 사용)
                 """
                 page_number = start_page_number + page_index
 
                 try:
-                    # 각 스레드가 독립적인 PDF 문서 인스턴스 생성
-                    # PyMuPDF는 각 Document 객체가 독립적이면 스레드 안전함
-                    temp_doc = fitz.open(stream=pdf_bytes, filetype="pdf")
-                    page = temp_doc[page_index]
+                    page = get_worker_document()[page_index]
 
-                    # DPI 기반 확대 비율 계산
-                    zoom = self.dpi / 72
-                    mat = fitz.Matrix(zoom, zoom)
-                    pix = page.get_pixmap(matrix=mat, alpha=False)
+                    pix = page.get_pixmap(matrix=self._matrix, alpha=False)
 
-                    # PIL Image로 변환
-                    img_data = pix.tobytes("jpeg")
-                    temp_doc.close()
-
-                    img = Image.open(io.BytesIO(img_data))
-                    width, height = img.size
+                    width, height = pix.width, pix.height
 
                     # 파일명 및 경로 생성
-                    filename = f"page_{page_number}.jpg"
+                    filename = f"page_{page_number}.{self.image_extension}"
                     full_path = project_dir / filename
                     public_path = Path("uploads") / str(project_id) / filename
 
-                    # 이미지 저장
-                    img.save(str(full_path), "JPEG", quality=self.jpeg_quality, optimize=True)
+                    # 이미지 저장 (Pixmap에서 직접 인코딩)
+                    self._save_pixmap(pix, full_path)
 
                     logger.debug(
                         f"페이지 {page_index + 1}/{total_pages} 변환 완료 - "
@@ -334,7 +388,9 @@ class PDFProcessor:
             raise
 
         finally:
-            # PDF 문서 닫기
+            # 워커 문서 및 PDF 문서 닫기
+            for document in worker_documents:
+                document.close()
             if pdf_document:
                 pdf_document.close()
 
@@ -348,12 +404,15 @@ class PDFProcessor:
         logger.warning(f"변환 롤백 시작 - {len(converted_pages)}개 파일 삭제")
 
         for page_info in converted_pages:
+            full_path = page_info.get('full_path')
+            if not full_path:
+                continue
             try:
-                full_path = page_info.get('full_path')
-                if full_path and os.path.exists(full_path):
-                    os.remove(full_path)
-                    logger.debug(f"파일 삭제: {full_path}")
-            except Exception as e:
+                os.unlink(full_path)
+                logger.debug(f"파일 삭제: {full_path}")
+            except FileNotFoundError:
+                pass
+            except OSError as e:
                 logger.error(f"롤백 중 파일 삭제 실패: {full_path}, 오류: {str(e)}")
 
         logger.info("변환 롤백 완료")
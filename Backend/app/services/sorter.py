@@ -62,6 +62,8 @@ class LayoutType(Enum):
 
 @dataclass
 class Zone:
+    __slots__ = ("x_min", "y_min", "x_max", "y_max")
+
     x_min: int
     y_min: int
     x_max: int
@@ -81,6 +83,8 @@ class Zone:
 
 @dataclass
 class HorizontalSplit:
+    __slots__ = ("top_zone", "bottom_zone", "separator_element")
+
     top_zone: Zone
     bottom_zone: Zone
     separator_element: MockElement
@@ -88,6 +92,8 @@ class HorizontalSplit:
 
 @dataclass
 class HorizontalSplitYGap:
+    __slots__ = ("top_zone", "bottom_zone", "split_y")
+
     top_zone: Zone
     bottom_zone: Zone
     split_y: float
@@ -95,6 +101,8 @@ class HorizontalSplitYGap:
 
 @dataclass
 class VerticalSplit:
+    __slots__ = ("left_zone", "right_zone", "gutter_x")
+
     left_zone: Zone
     right_zone: Zone
     gutter_x: float
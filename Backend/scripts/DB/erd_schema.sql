@@ -203,7 +203,8 @@ CREATE TABLE pages (
     UNIQUE KEY uk_project_page (project_id, page_number) 
         COMMENT '프로젝트 내 페이지 번호 중복 방지',
     INDEX idx_project_id (project_id) COMMENT '프로젝트별 페이지 조회 최적화',
-    INDEX idx_analysis_status (analysis_status) COMMENT '상태별 필터링 최적화'
+    INDEX idx_analysis_status (analysis_status) COMMENT '상태별 필터링 최적화',
+    INDEX idx_project_status (project_id, analysis_status) COMMENT '프로젝트별 상태 집계 최적화'
     
 ) ENGINE=InnoDB 
   DEFAULT CHARSET=utf8mb4 
@@ -449,7 +450,8 @@ CREATE TABLE text_versions (
     UNIQUE KEY uk_page_version (page_id, version_number) 
         COMMENT '페이지 내 버전 번호 중복 방지',
     INDEX idx_page_id (page_id) COMMENT '페이지별 버전 조회 최적화',
-    INDEX idx_is_current (is_current) COMMENT '현재 버전 빠른 조회'
+    INDEX idx_is_current (is_current) COMMENT '현재 버전 빠른 조회',
+    INDEX idx_page_current (page_id, is_current, created_at) COMMENT '페이지별 현재 버전/최신 시각 조회 최적화'
 ) ENGINE=InnoDB 
   DEFAULT CHARSET=utf8mb4 
   COLLATE=utf8mb4_unicode_ci
@@ -32,10 +32,16 @@ import io
 import colorsys
 import random
 from collections import Counter
+from datetime import datetime
 from typing import Optional
 from PIL import Image, ImageDraw, ImageFont
 import numpy as np
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - 선택 의존성
+    orjson = None
+
 # FastAPI 및 관련 패키지
 from fastapi import FastAPI, File, Form, UploadFile, HTTPException
 from fastapi.responses import JSONResponse, FileResponse
@@ -89,6 +95,20 @@ os.makedirs("static", exist_ok=True)
 app.mount("/static", StaticFiles(directory="static"), name="static")
 
 
+def save_json_file(filepath, data):
+    """분석 결과 JSON 파일 저장 (orjson 사용 가능 시 바이트로 직접 기록)"""
+    if orjson is not None:
+        with open(filepath, 'wb') as f:
+            f.write(orjson.dumps(
+                data,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+            ))
+        return
+
+    with open(filepath, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
+
+
 class WorksheetAnalyzer:
     """학습지 분석기 클래스 - Gradio 버전에서 이식"""
     
@@ -453,7 +473,6 @@ class WorksheetAnalyzer:
         try:
             font = ImageDraw.getfont()
         except:
-            from PIL import ImageFont
             try:
                 font = ImageFont.load_default()
             except:
@@ -480,7 +499,6 @@ class WorksheetAnalyzer:
 
     def create_cim_result(self, layout_info, ocr_results, ai_results):
         """CIM 결과 생성 (시각화 제거, JSON 통합만)"""
-        from datetime import datetime
         
         # JSON 통합 결과 생성
         cim_result = {
@@ -635,12 +653,10 @@ async def analyze_worksheet_structured(
         layout_viz_pil.save(layout_viz_path)
         
         # 구조화된 JSON 파일 저장
-        from datetime import datetime
         structured_filename = f"structured_analysis_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
         structured_filepath = f"static/{structured_filename}"
         
-        with open(structured_filepath, 'w', encoding='utf-8') as f:
-            json.dump(structured_result, f, indent=2, ensure_ascii=False)
+        save_json_file(structured_filepath, structured_result)
         
         # 🆕 구조화된 텍스트 생성
         structured_text = create_structured_text(structured_result)
@@ -732,12 +748,10 @@ async def analyze_worksheet(
         formatted_text = create_formatted_text(cim_result)
         
         # JSON 파일 저장
-        from datetime import datetime
         json_filename = f"analysis_result_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
         json_filepath = f"static/{json_filename}"
         
-        with open(json_filepath, 'w', encoding='utf-8') as f:
-            json.dump(cim_result, f, indent=2, ensure_ascii=False)
+        save_json_file(json_filepath, cim_result)
         
         # 통계 생성
         class_counts = Counter(item['class_name'] for item in layout_info)
@@ -840,7 +854,6 @@ async def save_as_word(
         title.alignment = WD_ALIGN_PARAGRAPH.CENTER
         
         # 현재 날짜 추가
-        from datetime import datetime
         date_paragraph = doc.add_paragraph(f"생성일: {datetime.now().strftime('%Y년 %m월 %d일 %H시 %M분')}")
         date_paragraph.alignment = WD_ALIGN_PARAGRAPH.RIGHT
         
@@ -1184,8 +1197,6 @@ def create_formatted_text(json_data):
 
 def log_system_and_openmp_info():
     """시스템 정보 및 OpenMP 설정 상태 로깅"""
-    import platform
-    
     print("=" * 60)
     print("🖥️  시스템 환경 정보")
     print("=" * 60)
@@ -4,186 +4,273 @@
 """
 
 import re
+from collections import defaultdict
 from typing import Dict, List, Optional
+
+import numpy as np
 from layout_analyzer_enhanced import EnhancedLayoutAnalyzer
 from loguru import logger
 
+# AI 결과와 문제 번호 사이 허용 최대 Y 거리 (이상이면 unknown)
+QUESTION_DISTANCE_THRESHOLD = 500
+
+# 선택지 번호 패턴: ① 형식 | (1) 형식 | 1. 형식 (앞선 대안 우선)
+CHOICE_NUMBER_PATTERN = re.compile(
+    r'^(?:([①②③④⑤⑥⑦⑧⑨⑩])|[(（]\s*([1-5])\s*[)）]|([1-5])\s*[.．])'
+)
+
+# bbox가 없는 요소의 정렬용 기본값 (비교마다 새 리스트를 만들지 않도록 튜플 상수 사용)
+ZERO_BBOX = (0, 0, 0, 0)
+
 class StructuredJSONGenerator:
+    __slots__ = ('layout_analyzer',)
+    
     def __init__(self):
         self.layout_analyzer = EnhancedLayoutAnalyzer()
     
     def generate_structured_json(self, ocr_results: List, ai_results: List, layout_elements: List) -> Dict:
         """구조화된 JSON 생성 (디버깅 강화)"""
         
-        # OCR 결과 캐시 (AI 매핑에서 사용)
-        self._cached_ocr_results = ocr_results
+        # 문제 번호 → Y 좌표 인덱스 (AI 매핑에서 사용, 인스턴스 상태로 두지 않고 인자로 전달)
+        question_y = self._build_question_y_index(ocr_results)
         
         # 🔍 디버깅: 입력 데이터 확인
-        logger.info(f"🔍 [DEBUG] OCR 결과 개수: {len(ocr_results)}")
-        logger.info(f"🔍 [DEBUG] AI 결과 개수: {len(ai_results)}")
-        logger.info(f"🔍 [DEBUG] 레이아웃 요소 개수: {len(layout_elements)}")
+        logger.debug("🔍 [DEBUG] OCR 결과 개수: {}", len(ocr_results))
+        logger.debug("🔍 [DEBUG] AI 결과 개수: {}", len(ai_results))
+        logger.debug("🔍 [DEBUG] 레이아웃 요소 개수: {}", len(layout_elements))
         
         # OCR 결과 샘플 출력
         if ocr_results:
-            logger.info(f"🔍 [DEBUG] OCR 샘플: {ocr_results[0]}")
+            logger.debug("🔍 [DEBUG] OCR 샘플: {}", ocr_results[0])
         
         # AI 결과 샘플 출력
         if ai_results:
-            logger.info(f"🔍 [DEBUG] AI 샘플: {ai_results[0]}")
+            logger.debug("🔍 [DEBUG] AI 샘플: {}", ai_results[0])
         
         # 레이아웃 요소 샘플 출력
         if layout_elements:
-            logger.info(f"🔍 [DEBUG] 레이아웃 샘플: {layout_elements[0]}")
+            logger.debug("🔍 [DEBUG] 레이아웃 샘플: {}", layout_elements[0])
         
         
         # 1. 문제 구조 분석
         logger.info("🔧 문제 구조 분석 시작...")
         structure = self.layout_analyzer.detect_question_structure(ocr_results, layout_elements)
         
-        logger.info(f"🔍 [DEBUG] 감지된 문제 구조: {structure}")
+        logger.debug("🔍 [DEBUG] 감지된 문제 구조: {}", structure)
         
         # 2. AI 결과를 문제별로 분류
-        ai_by_question = self._classify_ai_results_by_question(ai_results, structure)
+        ai_by_question = self._classify_ai_results_by_question(ai_results, structure, question_y)
         
-        # 3. 최종 구조화된 결과 생성
+        # 3. 최종 구조화된 결과 생성 (4. 각 문제별 정리를 리스트 컴프리헨션으로 한 번에 구성)
         structured_result = {
             'document_info': {
                 'total_questions': structure['total_questions'],
                 'layout_type': structure['layout_type'],
                 'sections': structure['sections']
             },
-            'questions': []
+            'questions': [
+                self._format_question_result(
+                    q_num, question_data, self._bucket_ai_results(ai_by_question.get(q_num, []))
+                )
+                for q_num, question_data in structure['questions'].items()
+            ]
         }
         
-        # 4. 각 문제별로 정리
-        for q_num, question_data in structure['questions'].items():
-            logger.info(f"🔍 [DEBUG] 문제 {q_num} 처리 중: {question_data}")
-            
-            question_result = self._format_question_result(
-                q_num, question_data, ai_by_question.get(q_num, [])
-            )
-            structured_result['questions'].append(question_result)
-        
-        logger.info(f"🔍 [DEBUG] 최종 구조화 결과: {len(structured_result['questions'])}개 문제")
+        logger.debug("🔍 [DEBUG] 최종 구조화 결과: {}개 문제", len(structured_result['questions']))
         
         return structured_result
     
-    def _classify_ai_results_by_question(self, ai_results: List, structure: Dict) -> Dict:
-        """AI 결과를 문제별로 분류 (디버깅 강화)"""
-        ai_by_question = {}
-        
-        logger.info(f"🔍 [DEBUG] AI 결과 분류 시작: {len(ai_results)}개 항목")
+    def _classify_ai_results_by_question(self, ai_results: List, structure: Dict, question_y: Dict[str, int]) -> Dict:
+        """AI 결과를 문제별로 분류 (가장 가까운 문제 번호 Y 좌표 기준)"""
+        ai_by_question = defaultdict(list)
+        
+        logger.debug("🔍 [DEBUG] AI 결과 분류 시작: {}개 항목", len(ai_results))
+        
+        # 문제 번호 / Y 좌표 병렬 배열 (structure 순서 유지 → 거리가 같으면 앞 문제 우선)
+        # (반복문 안의 속성/메서드 조회를 줄이기 위해 지역 변수로 바인딩)
+        get_question_y = self._get_question_y_from_ocr
+        q_nums = []
+        q_y_values = []
+        for q_num in structure.get('questions', {}):
+            q_y = get_question_y(q_num, question_y)
+            if q_y is not None:
+                q_nums.append(q_num)
+                q_y_values.append(q_y)
+        
+        # 위치를 알 수 있는 문제가 없으면 거리 계산/경고 없이 전부 unknown 처리
+        if not q_nums:
+            logger.debug("🔍 [DEBUG] Y 좌표를 가진 문제 없음 → AI 결과 {}개 모두 unknown", len(ai_results))
+            return {'unknown': list(ai_results)} if ai_results else {}
+        
+        q_ys = np.array(q_y_values, dtype=np.float64)
+        
+        # 유효한 coordinates를 가진 AI 결과만 Y 좌표 수집
+        assignments = ["unknown"] * len(ai_results)
+        valid_indices = []
+        ai_ys = []
+        add_index = valid_indices.append
+        add_y = ai_ys.append
+        for i, result in enumerate(ai_results):
+            ai_coords = result.get('coordinates') or ()
+            if len(ai_coords) < 2:
+                logger.warning("🔍 [DEBUG] AI 결과에 유효한 coordinates 없음: {}", result)
+                continue
+            add_index(i)
+            add_y(ai_coords[1])
+        
+        if valid_indices:
+            nearest = self._assign_nearest_questions(
+                np.array(ai_ys, dtype=np.float64), q_nums, q_ys
+            )
+            for i, question_num in zip(valid_indices, nearest):
+                assignments[i] = question_num
         
         for i, result in enumerate(ai_results):
-            logger.info(f"🔍 [DEBUG] AI 결과 {i}: {result}")
-            
-            # AI 결과의 위치나 내용을 기반으로 문제 번호 추정
-            question_num = self._estimate_question_for_ai_result(result, structure)
-            logger.info(f"🔍 [DEBUG] AI 결과 {i} → 문제 {question_num}에 할당")
-            
-            if question_num not in ai_by_question:
-                ai_by_question[question_num] = []
+            question_num = assignments[i]
+            logger.debug("🔍 [DEBUG] AI 결과 {} → 문제 {}에 할당", i, question_num)
             
             ai_by_question[question_num].append(result)
         
-        logger.info(f"🔍 [DEBUG] AI 분류 완료: {ai_by_question}")
-        return ai_by_question
+        logger.debug("🔍 [DEBUG] AI 분류 완료: {}", ai_by_question)
+        return dict(ai_by_question)
     
-    def _estimate_question_for_ai_result(self, result: Dict, structure: Dict) -> str:
-        """AI 결과가 어느 문제에 속하는지 추정 (개선)"""
-        
-        # coordinates 키 확인
-        ai_coords = result.get('coordinates', [])
-        if not ai_coords or len(ai_coords) < 2:
-            logger.warning(f"🔍 [DEBUG] AI 결과에 유효한 coordinates 없음: {result}")
-            return "unknown"
-        
-        ai_y = ai_coords[1]
-        logger.info(f"🔍 [DEBUG] AI 결과 Y 좌표: {ai_y}")
-        
-        # 가장 가까운 문제 찾기
-        best_question = "unknown"
-        min_distance = float('inf')
-        
-        # 문제별 Y 좌표를 OCR 결과에서 직접 찾기
-        questions = structure.get('questions', {})
-        for q_num in questions.keys():
-            q_y = self._get_question_y_from_ocr(q_num)
-            
-            if q_y is not None:
-                distance = abs(ai_y - q_y)
-                logger.debug(f"🔍 [DEBUG] 문제 {q_num} Y={q_y}, AI Y={ai_y}, 거리={distance}")
-                
-                if distance < min_distance:
-                    min_distance = distance
-                    best_question = q_num
-        
-        # 거리 임계값 확인 (너무 멀면 unknown)
-        if min_distance > 500:  # 500px 이상 차이나면 unknown
-            logger.warning(f"🔍 [DEBUG] 가장 가까운 문제와의 거리가 너무 큼: {min_distance}px")
-            best_question = "unknown"
-        
-        logger.info(f"🔍 [DEBUG] 가장 가까운 문제: {best_question} (거리: {min_distance})")
-        return best_question
+    def _assign_nearest_questions(self, ai_ys: np.ndarray, q_nums: List[str], q_ys: np.ndarray) -> List[str]:
+        """
+        AI 결과 Y 좌표마다 가장 가까운 문제 번호 반환
+        
+        문제 Y 좌표를 한 번 정렬한 뒤 searchsorted(이진 탐색)로 위/아래 이웃 문제만
+        비교하므로 O(A·log Q). 거리가 같으면 structure 순서상 앞선 문제를 선택.
+        q_nums는 비어 있지 않아야 함 (호출부에서 빈 경우를 먼저 처리).
+        """
+        # Y 오름차순 (같은 Y면 structure 순서) 정렬 후, 같은 Y는 첫 문제만 유지
+        order = np.lexsort((np.arange(len(q_ys)), q_ys))
+        sorted_ys = q_ys[order]
+        keep = np.ones(len(sorted_ys), dtype=bool)
+        keep[1:] = sorted_ys[1:] != sorted_ys[:-1]
+        sorted_ys = sorted_ys[keep]
+        sorted_idx = order[keep]
+        last = len(sorted_ys) - 1
+        
+        # pos-1: AI Y보다 위쪽 최근접 문제, pos: 같거나 아래쪽 최근접 문제
+        pos = np.searchsorted(sorted_ys, ai_ys, side='left')
+        left = np.clip(pos - 1, 0, last)
+        right = np.clip(pos, 0, last)
+        left_dist = np.where(pos > 0, ai_ys - sorted_ys[left], np.inf)
+        right_dist = np.where(pos <= last, sorted_ys[right] - ai_ys, np.inf)
+        
+        use_left = (left_dist < right_dist) | (
+            (left_dist == right_dist) & (sorted_idx[left] < sorted_idx[right])
+        )
+        best = np.where(use_left, sorted_idx[left], sorted_idx[right])
+        min_distances = np.minimum(left_dist, right_dist)
+        
+        nearest = []
+        for ai_y, idx, min_distance in zip(ai_ys.tolist(), best.tolist(), min_distances.tolist()):
+            # 거리 임계값 확인 (너무 멀면 unknown)
+            if min_distance > QUESTION_DISTANCE_THRESHOLD:
+                logger.warning("🔍 [DEBUG] 가장 가까운 문제와의 거리가 너무 큼: {}px", min_distance)
+                nearest.append("unknown")
+                continue
+            logger.debug("🔍 [DEBUG] AI Y={} → 가장 가까운 문제: {} (거리: {})", ai_y, q_nums[idx], min_distance)
+            nearest.append(q_nums[idx])
+        return nearest
     
-    def _get_question_y_from_ocr(self, question_num: str) -> Optional[int]:
-        """OCR 결과에서 특정 문제 번호의 Y 좌표 찾기"""
-        if hasattr(self, '_cached_ocr_results'):
-            for result in self._cached_ocr_results:
-                text = result.get('text', '').strip()
-                class_name = result.get('class_name', '')
-                
-                if text == question_num and class_name == 'question_number':
-                    coords = result.get('coordinates', [])
-                    if len(coords) > 1:
-                        return coords[1]
-        return None
+    def _build_question_y_index(self, ocr_results: List) -> Dict[str, int]:
+        """OCR 결과를 한 번 순회하여 문제 번호 → Y 좌표 인덱스 생성"""
+        question_y = {}
+        for result in ocr_results:
+            if result.get('class_name', '') != 'question_number':
+                continue
+            coords = result.get('coordinates', [])
+            if len(coords) > 1:
+                # 같은 번호가 여러 번 나오면 첫 번째 위치 사용
+                question_y.setdefault(result.get('text', '').strip(), coords[1])
+        return question_y
     
-    def _format_question_result(self, q_num: str, question_data: Dict, ai_results: List) -> Dict:
-        """문제별 결과 포맷팅 (디버깅 강화)"""
-        
-        logger.info(f"🔍 [DEBUG] 문제 {q_num} 포맷팅: elements={question_data.get('elements', {}).keys()}")
-        logger.info(f"🔍 [DEBUG] 문제 {q_num} AI 결과: {len(ai_results)}개")
-        
-        elements = question_data.get('elements', {})
+    def _get_question_y_from_ocr(self, question_num: str, question_y: Dict[str, int]) -> Optional[int]:
+        """OCR 결과에서 특정 문제 번호의 Y 좌표 찾기 (question_y: _build_question_y_index 결과)"""
+        return question_y.get(question_num)
+    
+    def _bucket_ai_results(self, ai_results: List) -> Dict[str, List]:
+        """AI 결과를 class_name 기준 figure / table / other로 한 번에 분류"""
+        figures = []
+        tables = []
+        others = []
+        add_figure = figures.append
+        add_table = tables.append
+        add_other = others.append
+        for result in ai_results:
+            class_name = result.get('class_name')
+            if class_name == 'figure':
+                add_figure(result)
+            elif class_name == 'table':
+                add_table(result)
+            else:
+                add_other(result)
+        return {'figure': figures, 'table': tables, 'other': others}
+    
+    def _format_question_result(self, q_num: str, question_data: Dict, ai_buckets: Dict[str, List]) -> Dict:
+        """문제별 결과 포맷팅 (ai_buckets: _bucket_ai_results로 분류된 AI 결과)"""
+        figure_results = ai_buckets['figure']
+        table_results = ai_buckets['table']
+        
+        # 요소 딕셔너리와 유형별 목록을 한 번만 꺼내 둠 (기본값은 호출마다 새로 만들지 않는 빈 튜플)
+        elements = question_data.get('elements') or {}
+        passage = elements.get('passage', ())
+        choices = elements.get('choices', ())
+        images = elements.get('images', ())
+        tables = elements.get('tables', ())
+        explanations = elements.get('explanations', ())
+        
+        logger.debug("🔍 [DEBUG] 문제 {} 포맷팅: elements={}", q_num, elements.keys())
+        logger.debug(
+            "🔍 [DEBUG] 문제 {} AI 결과: {}개", q_num,
+            len(figure_results) + len(table_results) + len(ai_buckets['other'])
+        )
         
         # 각 요소별 개수 로깅
         for element_type, element_list in elements.items():
-            logger.info(f"🔍 [DEBUG] 문제 {q_num} - {element_type}: {len(element_list)}개")
+            logger.debug("🔍 [DEBUG] 문제 {} - {}: {}개", q_num, element_type, len(element_list))
             if element_list:
-                logger.info(f"🔍 [DEBUG] 문제 {q_num} - {element_type} 샘플: {element_list[0]}")
+                logger.debug("🔍 [DEBUG] 문제 {} - {} 샘플: {}", q_num, element_type, element_list[0])
         
         return {
             'question_number': q_num,
             'section': question_data.get('section'),
             'question_content': {
                 'main_question': self._extract_main_question(elements),
-                'passage': self._combine_texts(elements.get('passage', [])),
-                'choices': self._format_choices(elements.get('choices', [])),
-                'images': self._format_images(elements.get('images', []), ai_results),
-                'tables': self._format_tables(elements.get('tables', []), ai_results),
-                'explanations': self._combine_texts(elements.get('explanations', []))
+                'passage': self._combine_texts(passage),
+                'choices': self._format_choices(choices),
+                'images': self._format_images(images, figure_results),
+                'tables': self._format_tables(tables, table_results),
+                'explanations': self._combine_texts(explanations)
             },
             'ai_analysis': {
-                'image_descriptions': [r for r in ai_results if r.get('class_name') == 'figure'],
-                'table_analysis': [r for r in ai_results if r.get('class_name') == 'table'],
-                'problem_analysis': [r for r in ai_results if r.get('class_name') not in ['figure', 'table']]
+                'image_descriptions': figure_results,
+                'table_analysis': table_results,
+                'problem_analysis': ai_buckets['other']
             }
         }
     
     def _extract_main_question(self, elements: Dict) -> str:
         """주요 문제 텍스트 추출 (디버깅 강화)"""
-        question_texts = elements.get('question_text', [])
-        logger.info(f"🔍 [DEBUG] 주요 문제 텍스트 추출: {len(question_texts)}개 후보")
+        question_texts = elements.get('question_text', ())
+        logger.debug("🔍 [DEBUG] 주요 문제 텍스트 추출: {}개 후보", len(question_texts))
         
         if question_texts:
-            # 가장 긴 텍스트를 주요 문제로 간주
-            main_text = max(question_texts, key=lambda x: len(x.get('text', '')))
-            result = main_text.get('text', '')
-            logger.info(f"🔍 [DEBUG] 선택된 주요 문제: '{result[:50]}...'")
+            # 가장 긴 텍스트를 주요 문제로 간주 (길이가 같으면 앞선 후보 유지)
+            result = ""
+            best_len = -1
+            for candidate in question_texts:
+                text = candidate.get('text', '')
+                text_len = len(text)
+                if text_len > best_len:
+                    best_len = text_len
+                    result = text
+            logger.debug("🔍 [DEBUG] 선택된 주요 문제: '{}...'", result[:50])
             return result
         
-        logger.info(f"🔍 [DEBUG] 주요 문제 텍스트 없음")
+        logger.debug("🔍 [DEBUG] 주요 문제 텍스트 없음")
         return ""
     
     def _combine_texts(self, text_elements: List) -> str:
@@ -191,13 +278,16 @@ class StructuredJSONGenerator:
         if not text_elements:
             return ""
         
-        logger.info(f"🔍 [DEBUG] 텍스트 결합: {len(text_elements)}개 요소")
+        logger.debug("🔍 [DEBUG] 텍스트 결합: {}개 요소", len(text_elements))
         
         # Y 좌표 순으로 정렬 후 결합
-        sorted_elements = sorted(text_elements, key=lambda x: x.get('bbox', [0, 0, 0, 0])[1])
-        result = " ".join([elem.get('text', '') for elem in sorted_elements])
+        # 빈 텍스트는 건너뛰어 이중 공백이 생기지 않도록 함
+        # (Y 값을 미리 뽑아 인덱스를 정렬 → 비교마다 lambda 호출 없음, 안정 정렬 유지)
+        ys = [elem.get('bbox', ZERO_BBOX)[1] for elem in text_elements]
+        order = sorted(range(len(ys)), key=ys.__getitem__)
+        result = " ".join(text for text in (text_elements[i].get('text', '') for i in order) if text)
         
-        logger.info(f"🔍 [DEBUG] 결합된 텍스트: '{result[:50]}...'")
+        logger.debug("🔍 [DEBUG] 결합된 텍스트: '{}...'", result[:50])
         return result
     
     def _format_choices(self, choice_elements: List) -> List[Dict]:
@@ -205,31 +295,36 @@ class StructuredJSONGenerator:
         if not choice_elements:
             return []
         
-        # Y 좌표 순으로 정렬
-        sorted_choices = sorted(choice_elements, key=lambda x: x['bbox'][1])
-        
-        formatted_choices = []
-        for i, choice in enumerate(sorted_choices):
-            formatted_choices.append({
+        # Y 좌표 순으로 정렬 (레이아웃 분석 결과가 이미 정렬된 경우가 많아 O(n) 확인 후 필요할 때만 정렬)
+        ys = [choice['bbox'][1] for choice in choice_elements]
+        if any(ys[i] > ys[i + 1] for i in range(len(ys) - 1)):
+            # 이미 뽑아 둔 Y 값으로 인덱스 정렬 (lambda 키 호출 없음)
+            order = sorted(range(len(ys)), key=ys.__getitem__)
+            sorted_choices = [choice_elements[i] for i in order]
+        else:
+            sorted_choices = choice_elements
+        
+        return [
+            {
                 'choice_number': self._extract_choice_number(choice['text']),
                 'choice_text': choice['text'],
                 'bbox': choice['bbox']
-            })
-        
-        return formatted_choices
+            }
+            for choice in sorted_choices
+        ]
     
     def _format_images(self, image_elements: List, ai_results: List) -> List[Dict]:
         """이미지 포맷팅"""
         formatted_images = []
         
+        # 모든 이미지에 첫 번째 figure AI 설명을 사용하므로 반복문 밖에서 한 번만 찾기
+        description = next(
+            (ai_result.get('description', '') for ai_result in ai_results
+             if ai_result.get('class_name') == 'figure'),
+            ""
+        )
+        
         for image in image_elements:
-            # 해당 이미지에 대한 AI 설명 찾기
-            description = ""
-            for ai_result in ai_results:
-                if ai_result.get('class_name') == 'figure':
-                    description = ai_result.get('description', '')
-                    break
-            
             formatted_images.append({
                 'bbox': image.get('box', image.get('bbox', [])),
                 'description': description,
@@ -242,14 +337,14 @@ class StructuredJSONGenerator:
         """표 포맷팅"""
         formatted_tables = []
         
+        # 모든 표에 첫 번째 table AI 설명을 사용하므로 반복문 밖에서 한 번만 찾기
+        description = next(
+            (ai_result.get('description', '') for ai_result in ai_results
+             if ai_result.get('class_name') == 'table'),
+            ""
+        )
+        
         for table in table_elements:
-            # 해당 표에 대한 AI 설명 찾기
-            description = ""
-            for ai_result in ai_results:
-                if ai_result.get('class_name') == 'table':
-                    description = ai_result.get('description', '')
-                    break
-            
             formatted_tables.append({
                 'bbox': table.get('box', table.get('bbox', [])),
                 'description': description,
@@ -260,15 +355,9 @@ class StructuredJSONGenerator:
     
     def _extract_choice_number(self, text: str) -> str:
         """선택지 번호 추출"""
-        patterns = [
-            r'^([①②③④⑤⑥⑦⑧⑨⑩])',
-            r'^[(（]\s*([1-5])\s*[)）]',
-            r'^([1-5])\s*[.．]'
-        ]
-        
-        for pattern in patterns:
-            match = re.match(pattern, text)
-            if match:
-                return match.group(1)
+        match = CHOICE_NUMBER_PATTERN.match(text)
+        if match:
+            # 세 대안 중 실제로 매칭된 그룹 하나만 값이 있음
+            return match.group(match.lastindex)
         
         return ""